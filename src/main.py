@@ -7,22 +7,29 @@ This script organizes files in a target directory based on file extension,
 placing them into category subfolders (e.g., Images, Documents).
 
 Features:
-- Command-line arguments for directory path, concurrency, and dry-run mode
-- Logging for visibility
-- Concurrency with ThreadPoolExecutor for faster file moves
+- Command-line arguments for directory path, concurrency, recursion, and dry-run mode
+- Summary logging, with per-file detail under --verbose
+- Concurrency with ThreadPoolExecutor for cross-filesystem file moves
 - Dry-run mode to preview actions without making changes
 
 Author: Your Name
 """
 
 import argparse
+import collections
+import ctypes
+import ctypes.util
+import errno
+import functools
 import logging
 import os
+import re
 import shutil
+import stat
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Counter, Dict, List, Optional, Set, Tuple, Union
 
 
 # Configure logging
@@ -43,6 +50,47 @@ FILE_CATEGORIES: Dict[str, List[str]] = {
     # Add more as needed...
 }
 
+# io_uring settings for the optional Linux batched-rename fast path
+IORING_OP_RENAMEAT = 35
+AT_FDCWD = -100
+URING_QUEUE_DEPTH = 256
+
+# Bytes per copy_file_range call when moving files across filesystems
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# A deferred log call: (level, message, args)
+LogEntry = Tuple[int, str, Tuple[object, ...]]
+
+# Files moved per category, plus log records worth emitting (errors, and
+# per-file moves when --verbose is on)
+BatchResult = Tuple[Counter[str], List[LogEntry]]
+
+# Flat extension -> category lookup, built once at import time. Common case
+# variants (".jpg", ".JPG", ".Jpg") are stored directly so most lookups don't
+# need to lower() the extension first.
+EXT_TO_CATEGORY: Dict[str, str] = {
+    variant: category
+    for category, extensions in FILE_CATEGORIES.items()
+    for ext in extensions
+    for variant in (ext, ext.upper(), "." + ext[1:].capitalize())
+}
+
+# Every folder name the organizer creates, skipped when recursing
+CATEGORY_NAMES = frozenset([*FILE_CATEGORIES, "Other"])
+
+# Case-insensitive matcher with one group per category, used for extensions
+# with unusual casing that miss the table above. Groups are named g0, g1, ...
+# since category names need not be valid identifiers (e.g. "Disk Images").
+PATTERN_CATEGORIES: List[str] = list(FILE_CATEGORIES)
+CATEGORY_PATTERN = re.compile(
+    "|".join(
+        "(?P<g%d>%s)" % (index, "|".join(map(re.escape, FILE_CATEGORIES[category])))
+        for index, category in enumerate(PATTERN_CATEGORIES)
+    ),
+    # ASCII-only case folding, matching str.lower() on these ASCII extensions
+    re.IGNORECASE | re.ASCII,
+)
+
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -68,96 +116,676 @@ def parse_arguments() -> argparse.Namespace:
         "--workers",
         type=int,
         default=4,
-        help="Number of worker threads to use for concurrency (default: 4)."
+        help="Number of worker threads to use for cross-filesystem moves (default: 4)."
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Also organize files in subdirectories (category folders are skipped)."
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every file moved instead of only a per-category summary."
+    )
+    parser.add_argument(
+        "--io-uring",
+        action="store_true",
+        help="Experimental: batch renames through io_uring on Linux (needs liburing-ffi)."
     )
     args = parser.parse_args()
     return args
 
 
-def categorize_file(file_path: Path) -> str:
+def categorize_file(file_path: Union[Path, str]) -> str:
     """
     Determine the category name for a file based on its extension.
     
     Args:
-        file_path (Path): The path to the file being categorized.
+        file_path (Union[Path, str]): The file being categorized, either as a
+            Path or as a bare file name.
     
     Returns:
         str: The folder/category name the file should be moved into.
     """
-    extension = file_path.suffix.lower()
-    for category, extensions in FILE_CATEGORIES.items():
-        if extension in extensions:
-            return category
-    return "Other"
+    # Slice the name directly instead of going through Path.suffix
+    name = file_path.name if isinstance(file_path, Path) else file_path
+    dot = name.rfind(".")
+    if dot <= 0:
+        # No extension, or a dotfile such as ".bashrc"
+        return "Other"
+    extension = name[dot:]
+    category = EXT_TO_CATEGORY.get(extension)
+    if category is not None:
+        return category
+    # Lower, upper and capitalized spellings are all in the table, so a miss on
+    # one of those is an unknown extension; skip the regex for that common case
+    if extension.islower() or extension.isupper() or extension.istitle():
+        return "Other"
+    # Fall back for unusual casing such as ".JpG" without lowering a copy
+    match = CATEGORY_PATTERN.fullmatch(extension)
+    return PATTERN_CATEGORIES[match.lastindex - 1] if match else "Other"
 
 
-def organize_file(file_path: Path, target_dir: Path, dry_run: bool = False) -> None:
+def move_across_devices(src_path: str, destination: str) -> None:
     """
-    Move a single file to the appropriate category folder within target_dir.
+    Move a file to another filesystem by copying it and removing the original.
+    
+    The destination is created exclusively, so an existing file is never
+    overwritten, and it is removed again if any part of the copy fails. On
+    Linux the data is copied in-kernel with os.copy_file_range (which can
+    also reflink); elsewhere, or if the filesystems don't support it,
+    shutil.copyfile is used. Metadata is copied as shutil.move would.
+    
+    Args:
+        src_path (str): Full path to the file being moved.
+        destination (str): Full path the file should end up at.
+    
+    Raises:
+        OSError: If the copy or removal of the original fails.
+    """
+    # Claim the name first; FileExistsError here must not remove the other file
+    dst = open(destination, "xb")
+    try:
+        copied = False
+        with dst:
+            if hasattr(os, "copy_file_range"):
+                with open(src_path, "rb") as src:
+                    try:
+                        while os.copy_file_range(src.fileno(), dst.fileno(), COPY_CHUNK_SIZE):
+                            pass
+                        copied = True
+                    except OSError as e:
+                        if e.errno not in (
+                            errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP
+                        ):
+                            raise
+        if not copied:
+            # The destination was created above, so rewriting it here is safe
+            shutil.copyfile(src_path, destination)
+        shutil.copystat(src_path, destination)
+    except BaseException:
+        try:
+            os.unlink(destination)
+        except OSError:
+            pass
+        raise
+    os.unlink(src_path)
+
+
+def moved_record(name: str, category: str, dest_name: str) -> LogEntry:
+    """
+    Build the DEBUG log record for a successful move.
     
     Args:
-        file_path (Path): Path to the file that needs to be organized.
-        target_dir (Path): The root directory where organized subfolders are created.
-        dry_run (bool): If True, simulate the move but don't actually move the file.
+        name (str): Original file name.
+        category (str): The category the file was moved into.
+        dest_name (str): Name the file was given in the category folder.
+    
+    Returns:
+        LogEntry: The log record describing the move.
+    """
+    if dest_name != name:
+        return logging.DEBUG, "Moved: %s -> %s as %s", (name, category, dest_name)
+    return logging.DEBUG, "Moved: %s -> %s", (name, category)
+
+
+def recover_failed_rename(
+    name: str, src_path: str, category: str, dest_name: str, destination: str, error: OSError
+) -> LogEntry:
+    """
+    Finish a move whose rename failed, copying across devices on EXDEV.
+    
+    Args:
+        name (str): Original file name.
+        src_path (str): Full path to the file being moved.
+        category (str): The category the file belongs to.
+        dest_name (str): Name to give the file in the category folder.
+        destination (str): Full destination path.
+        error (OSError): The error the rename failed with.
+    
+    Returns:
+        LogEntry: The log record describing the outcome.
     """
-    category = categorize_file(file_path)
-    category_folder = target_dir / category
+    if error.errno != errno.EXDEV:
+        return logging.ERROR, "Failed to move %s: %s", (name, error)
+    # The category folder is on another filesystem (e.g. a mount point)
+    try:
+        move_across_devices(src_path, destination)
+    except OSError as e:
+        return logging.ERROR, "Failed to move %s: %s", (name, e)
+    return moved_record(name, category, dest_name)
 
-    if not category_folder.exists():
-        if not dry_run:
-            category_folder.mkdir(parents=True, exist_ok=True)
-        logging.info("Created folder: %s", category_folder)
 
-    if not dry_run:
-        destination = category_folder / file_path.name
+def move_batch(
+    batch: List[Tuple[str, str, str, str]], category_dirs: Dict[str, str]
+) -> BatchResult:
+    """
+    Organize a batch of files sequentially within a single worker thread.
+    
+    Args:
+        batch (List[Tuple[str, str, str, str]]): (name, src_path, category, dest_name)
+            entries to organize.
+        category_dirs (Dict[str, str]): Mapping of category name to its folder path.
+    
+    Returns:
+        BatchResult: Per-category move counts and the log records for the
+            batch, emitted by the caller once the batch is done.
+    """
+    counts: Counter[str] = collections.Counter()
+    records: List[LogEntry] = []
+    # Checked once per batch; per-file records are only built when they'll be shown
+    verbose = logging.getLogger().isEnabledFor(logging.DEBUG)
+    # Rename inline in this loop; failures are finished by recover_failed_rename.
+    # os.rename releases the GIL while the syscall runs
+    rename = os.rename
+    sep = os.sep
+    for name, src_path, category, dest_name in batch:
+        destination = category_dirs[category] + sep + dest_name
         try:
-            shutil.move(str(file_path), str(destination))
-            logging.info("Moved: %s -> %s", file_path.name, category)
-        except shutil.Error as e:
-            logging.error("Failed to move %s: %s", file_path.name, e)
-    else:
-        logging.info("[DRY RUN] Would move: %s -> %s", file_path.name, category)
+            rename(src_path, destination)
+        except OSError as e:
+            try:
+                record = recover_failed_rename(
+                    name, src_path, category, dest_name, destination, e
+                )
+            except Exception as exc:
+                record = (logging.ERROR, "Error organizing %s: %s", (name, exc))
+            if record[0] >= logging.ERROR:
+                records.append(record)
+                continue
+        else:
+            record = None
+        counts[category] += 1
+        if verbose:
+            records.append(record or moved_record(name, category, dest_name))
+    return counts, records
+
+
+class IoUringCqe(ctypes.Structure):
+    """Completion queue entry as laid out by the kernel (struct io_uring_cqe)."""
+
+    _fields_ = [
+        ("user_data", ctypes.c_uint64),
+        ("res", ctypes.c_int32),
+        ("flags", ctypes.c_uint32),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def load_liburing() -> Optional[ctypes.CDLL]:
+    """
+    Load liburing's FFI library if this kernel supports batched renames via io_uring.
+    
+    liburing-ffi exports the helpers (io_uring_prep_renameat etc.) that are
+    static inline in the C header, so they can be called through ctypes.
+    
+    Returns:
+        Optional[ctypes.CDLL]: The loaded library, or None if io_uring renames
+            are unavailable and per-file os.rename should be used instead.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    lib_name = ctypes.util.find_library("uring-ffi")
+    if lib_name is None:
+        return None
+    try:
+        lib = ctypes.CDLL(lib_name, use_errno=True)
+        lib.io_uring_get_probe.restype = ctypes.c_void_p
+        lib.io_uring_opcode_supported.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.io_uring_free_probe.argtypes = [ctypes.c_void_p]
+        lib.io_uring_queue_init.argtypes = [ctypes.c_uint, ctypes.c_void_p, ctypes.c_uint]
+        lib.io_uring_queue_exit.argtypes = [ctypes.c_void_p]
+        lib.io_uring_get_sqe.restype = ctypes.c_void_p
+        lib.io_uring_get_sqe.argtypes = [ctypes.c_void_p]
+        lib.io_uring_prep_renameat.argtypes = [
+            ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p,
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint,
+        ]
+        lib.io_uring_sqe_set_data64.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+        lib.io_uring_submit_and_wait.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+        lib.io_uring_wait_cqe.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.POINTER(IoUringCqe)),
+        ]
+        lib.io_uring_cqe_seen.argtypes = [ctypes.c_void_p, ctypes.POINTER(IoUringCqe)]
+    except (OSError, AttributeError):
+        return None
+
+    probe = lib.io_uring_get_probe()
+    if not probe:
+        return None
+    try:
+        if not lib.io_uring_opcode_supported(probe, IORING_OP_RENAMEAT):
+            return None
+    finally:
+        lib.io_uring_free_probe(probe)
+    return lib
+
+
+def rename_batch_uring(
+    lib: ctypes.CDLL, pairs: List[Tuple[str, str]]
+) -> List[Optional[int]]:
+    """
+    Rename many files with io_uring, entering the kernel once per queue-depth chunk.
+    
+    Args:
+        lib (ctypes.CDLL): The library returned by load_liburing.
+        pairs (List[Tuple[str, str]]): (src_path, dest_path) pairs to rename.
+    
+    Returns:
+        List[Optional[int]]: The result for each pair: 0 on success, otherwise
+            -errno. None marks pairs whose outcome is unknown because submission
+            failed part-way through; the caller must handle those itself.
+    
+    Raises:
+        OSError: If the ring could not be set up, in which case nothing was renamed.
+    """
+    results: List[Optional[int]] = [None] * len(pairs)
+    # struct io_uring is opaque here; over-allocate rather than mirror its layout
+    ring = ctypes.create_string_buffer(1024)
+    ret = lib.io_uring_queue_init(URING_QUEUE_DEPTH, ring, 0)
+    if ret < 0:
+        raise OSError(-ret, os.strerror(-ret))
+    try:
+        cqe = ctypes.POINTER(IoUringCqe)()
+        for start in range(0, len(pairs), URING_QUEUE_DEPTH):
+            chunk = pairs[start:start + URING_QUEUE_DEPTH]
+            # Keep the encoded paths alive until the kernel has consumed them
+            encoded = [(os.fsencode(src), os.fsencode(dest)) for src, dest in chunk]
+            for offset, (src, dest) in enumerate(encoded):
+                sqe = lib.io_uring_get_sqe(ring)
+                lib.io_uring_prep_renameat(sqe, AT_FDCWD, src, AT_FDCWD, dest, 0)
+                lib.io_uring_sqe_set_data64(sqe, start + offset)
+            ret = lib.io_uring_submit_and_wait(ring, len(chunk))
+            if ret < 0:
+                logging.warning("io_uring submission failed: %s", os.strerror(-ret))
+                break
+            for _ in chunk:
+                ret = lib.io_uring_wait_cqe(ring, ctypes.byref(cqe))
+                if ret < 0:
+                    break
+                results[cqe.contents.user_data] = cqe.contents.res
+                lib.io_uring_cqe_seen(ring, cqe)
+            if ret < 0:
+                logging.warning("io_uring completion failed: %s", os.strerror(-ret))
+                break
+    finally:
+        lib.io_uring_queue_exit(ring)
+    return results
+
+
+def move_batch_uring(
+    lib: ctypes.CDLL, batch: List[Tuple[str, str, str, str]], category_dirs: Dict[str, str]
+) -> BatchResult:
+    """
+    Organize a batch of files using a single io_uring submission per chunk.
+    
+    Files whose rename fails with EXDEV still get the cross-device copy
+    fallback (see recover_failed_rename).
+    
+    Args:
+        lib (ctypes.CDLL): The library returned by load_liburing.
+        batch (List[Tuple[str, str, str, str]]): (name, src_path, category, dest_name)
+            entries to organize.
+        category_dirs (Dict[str, str]): Mapping of category name to its folder path.
+    
+    Returns:
+        BatchResult: Per-category move counts and the log records for the
+            batch, to be emitted by the caller.
+    """
+    pairs = [
+        (src_path, category_dirs[category] + os.sep + dest_name)
+        for _, src_path, category, dest_name in batch
+    ]
+    results = rename_batch_uring(lib, pairs)
+
+    counts: Counter[str] = collections.Counter()
+    records: List[LogEntry] = []
+    verbose = logging.getLogger().isEnabledFor(logging.DEBUG)
+    leftover = []
+    for entry, (_, destination), res in zip(batch, pairs, results):
+        name, src_path, category, dest_name = entry
+        if res is None:
+            # Submitted or not, the outcome was never reported. A rename that did
+            # go through leaves the source gone and the destination in place.
+            if not os.path.lexists(src_path) and os.path.lexists(destination):
+                res = 0
+            else:
+                leftover.append(entry)
+                continue
+        if res == 0:
+            counts[category] += 1
+            if not verbose:
+                continue
+            record = moved_record(name, category, dest_name)
+        else:
+            record = recover_failed_rename(
+                name, src_path, category, dest_name, destination,
+                OSError(-res, os.strerror(-res)),
+            )
+            if record[0] < logging.ERROR:
+                counts[category] += 1
+                if not verbose:
+                    continue
+        records.append(record)
+
+    if leftover:
+        # Only the entries io_uring never handled go through per-file renames
+        leftover_counts, leftover_records = move_batch(leftover, category_dirs)
+        counts.update(leftover_counts)
+        records.extend(leftover_records)
+    return counts, records
+
+
+def build_category_dirs(target_str: str) -> Dict[str, str]:
+    """
+    Precompute the folder path for every category within the target directory.
+    
+    Paths are plain strings so the move loop can build destinations by
+    concatenation, with no Path arithmetic or str() per file.
+    
+    Args:
+        target_str (str): The root directory where organized subfolders are created.
+    
+    Returns:
+        Dict[str, str]: Mapping of category name to its folder path.
+    """
+    return {
+        category: os.path.join(target_str, category)
+        for category in CATEGORY_NAMES
+    }
+
+
+def create_category_folders(category_dirs: Dict[str, str], categories: Set[str]) -> Set[str]:
+    """
+    Create the category subfolders needed for this run, once per category.
+    
+    Args:
+        category_dirs (Dict[str, str]): Mapping of category name to its folder path.
+        categories (Set[str]): The categories that will receive at least one file.
+    
+    Returns:
+        Set[str]: The categories whose folder exists and can receive files.
+            Categories whose path is taken by a non-directory, or whose folder
+            could not be created, are logged and left out.
+    """
+    usable = set()
+    for category in sorted(categories):
+        category_folder = category_dirs[category]
+        try:
+            os.mkdir(category_folder)
+            logging.info("Created folder: %s", category_folder)
+        except FileExistsError:
+            if not os.path.isdir(category_folder):
+                logging.error(
+                    "Cannot use '%s' as the %s folder: it exists and is not a directory.",
+                    category_folder, category
+                )
+                continue
+        except OSError as e:
+            logging.error("Failed to create folder %s: %s", category_folder, e)
+            continue
+        usable.add(category)
+    return usable
+
+
+def collect_files(target_str: str, recursive: bool = False) -> Tuple[List[str], List[str]]:
+    """
+    List the files to organize as parallel arrays of names and source paths.
+    
+    Directories are read with os.scandir, whose entries carry the file type
+    from readdir, so no stat() is needed per entry at any depth. Symlinks are
+    not followed. Subdirectories that can't be read are logged and skipped;
+    only a failure to read target_str itself is raised.
+    
+    Args:
+        target_str (str): The directory containing files to organize.
+        recursive (bool): If True, also descend into subdirectories, skipping
+            the category folders at the top level.
+    
+    Returns:
+        Tuple[List[str], List[str]]: File names and their full paths, index-aligned.
+    
+    Raises:
+        OSError: If target_str itself can't be listed.
+    """
+    names: List[str] = []
+    srcs: List[str] = []
+    pending = [target_str]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        names.append(entry.name)
+                        srcs.append(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        if current == target_str and entry.name in CATEGORY_NAMES:
+                            continue
+                        pending.append(entry.path)
+        except OSError as e:
+            if current == target_str:
+                raise
+            logging.warning("Skipping unreadable directory %s: %s", current, e)
+    return names, srcs
+
+
+def is_case_insensitive(folder: str) -> bool:
+    """
+    Check whether names in an existing folder are matched case-insensitively.
+    
+    Args:
+        folder (str): An existing directory whose name contains letters.
+    
+    Returns:
+        bool: True if the filesystem treats differently-cased names as the same
+            entry (the default on macOS and Windows).
+    """
+    head, tail = os.path.split(folder)
+    swapped = os.path.join(head, tail.swapcase())
+    try:
+        return os.path.samefile(folder, swapped)
+    except OSError:
+        return False
+
+
+def assign_destination_names(
+    names: List[str],
+    cats: List[str],
+    category_dirs: Dict[str, str],
+    categories: Set[str],
+) -> List[str]:
+    """
+    Pick a non-clashing destination name for every file.
+    
+    Each category folder is listed once up front; clashes with files already
+    there (or assigned earlier in this run) are resolved in memory by adding a
+    numeric suffix, e.g. "report_1.pdf", so no stat() is needed per file. On
+    case-insensitive filesystems names are compared case-folded, so "A.JPG"
+    clashes with an existing "a.jpg".
+    
+    Args:
+        names (List[str]): File names to place.
+        cats (List[str]): The category of each file, index-aligned with names.
+        category_dirs (Dict[str, str]): Mapping of category name to its folder path.
+        categories (Set[str]): The categories that will receive at least one file.
+    
+    Returns:
+        List[str]: The destination name for each file, index-aligned with names.
+    """
+    folded = {
+        category: is_case_insensitive(category_dirs[category]) for category in categories
+    }
+    existing = {
+        category: {
+            entry.casefold() if folded[category] else entry
+            for entry in os.listdir(category_dirs[category])
+        }
+        for category in categories
+    }
+
+    # Next suffix to try per (category, name), so repeated clashes stay O(1)
+    counters: Dict[Tuple[str, str], int] = {}
+    dest_names = []
+    for name, category in zip(names, cats):
+        taken = existing[category]
+        fold = folded[category]
+        dest_name = name
+        key = name.casefold() if fold else name
+        if key in taken:
+            dot = name.rfind(".")
+            stem, ext = (name[:dot], name[dot:]) if dot > 0 else (name, "")
+            n = counters.get((category, key), 1)
+            while True:
+                dest_name = f"{stem}_{n}{ext}"
+                candidate = dest_name.casefold() if fold else dest_name
+                if candidate not in taken:
+                    break
+                n += 1
+            counters[(category, key)] = n + 1
+            key = candidate
+        taken.add(key)
+        dest_names.append(dest_name)
+    return dest_names
+
 
+def can_rename(
+    target_dev: int, category_dirs: Dict[str, str], categories: Set[str]
+) -> bool:
+    """
+    Check whether every category folder in use is on the same filesystem as the target.
+    
+    Args:
+        target_dev (int): st_dev of the directory containing files to organize.
+        category_dirs (Dict[str, str]): Mapping of category name to its folder path.
+        categories (Set[str]): The categories that will receive at least one file.
+    
+    Returns:
+        bool: True if all moves can be done with a plain rename.
+    """
+    return all(
+        os.stat(category_dirs[category]).st_dev == target_dev for category in categories
+    )
 
-def organize_directory(target_dir: Path, dry_run: bool, workers: int = 4) -> None:
+
+def organize_directory(
+    target_dir: Path,
+    dry_run: bool,
+    workers: int = 4,
+    recursive: bool = False,
+    use_io_uring: bool = False,
+) -> None:
     """
     Organize all files within the target directory into categorized subfolders.
     
     Args:
         target_dir (Path): The directory containing files to organize.
         dry_run (bool): If True, only simulate the moves.
-        workers (int): Number of threads for concurrent file moves.
+        workers (int): Number of threads for concurrent file moves. Only used when
+            moves cross filesystems; same-filesystem renames run serially.
+        recursive (bool): If True, also organize files found in subdirectories.
+        use_io_uring (bool): If True, batch same-filesystem renames through
+            io_uring when liburing-ffi is available (experimental, opt-in).
     """
-    if not target_dir.is_dir():
+    # Stat and stringify the target once; both are reused for the whole run
+    target_str = os.fspath(target_dir)
+    try:
+        target_stat = os.stat(target_str)
+    except OSError:
+        target_stat = None
+    if target_stat is None or not stat.S_ISDIR(target_stat.st_mode):
         logging.error("Target path '%s' is not a valid directory.", target_dir)
         sys.exit(1)
 
-    # Gather all files (non-recursively) in the target directory
-    files_to_organize = [f for f in target_dir.iterdir() if f.is_file()]
+    # Files are carried as parallel arrays (names, srcs, cats) rather than a
+    # list of per-file objects; each pass below is one tight loop over them
+    names, srcs = collect_files(target_str, recursive)
 
-    if not files_to_organize:
+    if not names:
         logging.info("No files found in '%s'. Nothing to organize.", target_dir)
         return
 
     logging.info(
         "Starting organization of %d files in '%s' (Dry run: %s, Workers: %d).",
-        len(files_to_organize), target_dir, dry_run, workers
+        len(names), target_dir, dry_run, workers
     )
 
-    # Use threading to speed up organizing many files
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_to_file = {
-            executor.submit(organize_file, f, target_dir, dry_run): f
-            for f in files_to_organize
-        }
+    # Categorize everything up front so each folder is created only once
+    cats = [categorize_file(name) for name in names]
 
-        for future in as_completed(future_to_file):
-            file_path = future_to_file[future]
+    if dry_run:
+        # Pure in-memory preview: no folder checks, listings or Path work
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for name, category in zip(names, cats):
+                logging.debug("[DRY RUN] Would move: %s -> %s", name, category)
+        logging.info(
+            "[DRY RUN] Would organize %d files: %s",
+            len(names), dict(collections.Counter(cats))
+        )
+        logging.info("Completed organizing files in '%s'.", target_dir)
+        return
+
+    total = len(names)
+    category_dirs = build_category_dirs(target_str)
+    categories_used = create_category_folders(category_dirs, set(cats))
+    if len(categories_used) < len(set(cats)):
+        # Files whose category folder is unusable stay where they are
+        keep = [i for i, category in enumerate(cats) if category in categories_used]
+        for i in sorted(set(range(total)).difference(keep)):
+            logging.error("Error organizing %s: no usable %s folder", names[i], cats[i])
+        names = [names[i] for i in keep]
+        srcs = [srcs[i] for i in keep]
+        cats = [cats[i] for i in keep]
+    dest_names = assign_destination_names(names, cats, category_dirs, categories_used)
+    categorized = list(zip(names, srcs, cats, dest_names))
+
+    if can_rename(target_stat.st_dev, category_dirs, categories_used):
+        # Each rename is only a few microseconds of kernel work, less than the
+        # cost of dispatching it to a thread, so run these serially. On Linux,
+        # optionally batch them through io_uring.
+        result = None
+        lib = load_liburing() if use_io_uring else None
+        if use_io_uring and lib is None:
+            logging.warning("io_uring renames unavailable, using per-file renames.")
+        if lib is not None:
             try:
-                future.result()  # If an exception is raised, it will appear here
-            except Exception as exc:
-                logging.error("Error organizing %s: %s", file_path.name, exc)
+                result = move_batch_uring(lib, categorized, category_dirs)
+            except OSError as e:
+                logging.warning("io_uring renames unavailable, falling back: %s", e)
+        if result is None:
+            result = move_batch(categorized, category_dirs)
+        counts, records = result
+        for level, msg, msg_args in records:
+            logging.log(level, msg, *msg_args)
+    else:
+        # Cross-device moves copy file data, so threads help here. Each worker
+        # gets one coarse batch rather than one task per file.
+        batches = [categorized[i::workers] for i in range(workers)]
+        counts = collections.Counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(move_batch, batch, category_dirs)
+                for batch in batches
+                if batch
+            ]
 
+            # No per-future metadata is kept: move_batch reports each file itself
+            for future in as_completed(futures):
+                try:
+                    batch_counts, records = future.result()
+                except Exception as exc:
+                    logging.error("Error organizing batch: %s", exc)
+                    continue
+                counts.update(batch_counts)
+                for level, msg, msg_args in records:
+                    logging.log(level, msg, *msg_args)
+
+    moved = sum(counts.values())
+    logging.info(
+        "Organized %d files (%d failed): %s",
+        moved, total - moved, dict(counts)
+    )
     logging.info("Completed organizing files in '%s'.", target_dir)
 
 
@@ -167,13 +795,22 @@ def main() -> None:
     """
     args = parse_arguments()
     target_dir = Path(args.target_directory).resolve()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
 
     logging.info("File Organizer Script Starting")
     logging.info("Target directory: %s", target_dir)
     logging.info("Dry run mode: %s", args.dry_run)
     logging.info("Worker threads: %d", args.workers)
+    logging.info("Recursive: %s", args.recursive)
 
-    organize_directory(target_dir, args.dry_run, workers=args.workers)
+    organize_directory(
+        target_dir,
+        args.dry_run,
+        workers=args.workers,
+        recursive=args.recursive,
+        use_io_uring=args.io_uring,
+    )
 
     logging.info("File Organizer Script Finished")
 
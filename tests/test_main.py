@@ -0,0 +1,232 @@
+"""Tests for the file organizer in src/main.py."""
+
+import errno
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import main  # noqa: E402
+
+
+class CategorizeFileTests(unittest.TestCase):
+    def test_mixed_case_extension(self) -> None:
+        self.assertEqual(main.categorize_file("photo.JpG"), "Images")
+        self.assertEqual(main.categorize_file(Path("notes.tXt")), "Documents")
+
+    def test_unknown_and_missing_extensions(self) -> None:
+        self.assertEqual(main.categorize_file("data.xYz"), "Other")
+        self.assertEqual(main.categorize_file("Makefile"), "Other")
+        self.assertEqual(main.categorize_file(".py"), "Other")
+
+    def test_non_ascii_case_folding_is_not_matched(self) -> None:
+        # U+017F LATIN SMALL LETTER LONG S folds to "s" under Unicode rules
+        self.assertEqual(main.categorize_file("x.\u017fVG"), "Other")
+
+
+class MoveAcrossDevicesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self._tmp.name, "src.txt")
+        self.dst = os.path.join(self._tmp.name, "dst.txt")
+        Path(self.src).write_text("data")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_moves_file(self) -> None:
+        main.move_across_devices(self.src, self.dst)
+
+        self.assertFalse(os.path.exists(self.src))
+        self.assertEqual(Path(self.dst).read_text(), "data")
+
+    def test_existing_destination_is_not_overwritten(self) -> None:
+        Path(self.dst).write_text("keep")
+
+        with self.assertRaises(FileExistsError):
+            main.move_across_devices(self.src, self.dst)
+
+        self.assertEqual(Path(self.dst).read_text(), "keep")
+        self.assertTrue(os.path.exists(self.src))
+
+    def test_failed_copy_removes_partial_destination(self) -> None:
+        with mock.patch.object(main.shutil, "copystat", side_effect=PermissionError):
+            with self.assertRaises(PermissionError):
+                main.move_across_devices(self.src, self.dst)
+
+        self.assertFalse(os.path.exists(self.dst))
+        self.assertTrue(os.path.exists(self.src))
+
+
+class OrganizeDirectoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.target = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def touch(self, *parts: str, content: str = "") -> Path:
+        path = self.target.joinpath(*parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        return path
+
+    def organize(self) -> None:
+        with self.assertLogs(level="INFO"):
+            main.organize_directory(self.target, dry_run=False)
+
+    def test_clashing_name_gets_numeric_suffix(self) -> None:
+        self.touch("Images", "photo.jpg", content="old")
+        self.touch("photo.jpg", content="new")
+
+        self.organize()
+
+        self.assertEqual((self.target / "Images" / "photo.jpg").read_text(), "old")
+        self.assertEqual((self.target / "Images" / "photo_1.jpg").read_text(), "new")
+
+    def test_suffix_skips_names_already_taken(self) -> None:
+        self.touch("Images", "photo.jpg")
+        self.touch("Images", "photo_1.jpg")
+        self.touch("photo.jpg", content="new")
+
+        self.organize()
+
+        self.assertEqual((self.target / "Images" / "photo_2.jpg").read_text(), "new")
+
+    def test_case_insensitive_clash_is_detected(self) -> None:
+        self.touch("Images", "photo.jpg", content="old")
+        self.touch("PHOTO.JPG", content="new")
+
+        with mock.patch.object(main, "is_case_insensitive", return_value=True):
+            self.organize()
+
+        self.assertEqual((self.target / "Images" / "photo.jpg").read_text(), "old")
+        self.assertEqual((self.target / "Images" / "PHOTO_1.JPG").read_text(), "new")
+
+    def test_file_named_like_category_does_not_abort_run(self) -> None:
+        self.touch("Other")
+        self.touch("x.jpg")
+
+        with self.assertLogs(level="ERROR"):
+            main.organize_directory(self.target, dry_run=False)
+
+        self.assertTrue((self.target / "Other").is_file())
+        self.assertTrue((self.target / "Images" / "x.jpg").is_file())
+
+
+class MoveBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self._tmp.name, "Images")
+        os.mkdir(self.folder)
+        self.src = os.path.join(self._tmp.name, "a.jpg")
+        Path(self.src).touch()
+        self.batch = [("a.jpg", self.src, "Images", "a.jpg")]
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_cross_device_rename_copies_without_retrying(self) -> None:
+        exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+        with mock.patch.object(main.os, "rename", side_effect=exdev) as rename:
+            counts, records = main.move_batch(self.batch, {"Images": self.folder})
+
+        self.assertEqual(rename.call_count, 1)
+        self.assertEqual(counts, {"Images": 1})
+        self.assertEqual(records, [])
+        self.assertTrue(os.path.exists(os.path.join(self.folder, "a.jpg")))
+
+    def test_failed_rename_is_reported(self) -> None:
+        os.unlink(self.src)
+
+        counts, records = main.move_batch(self.batch, {"Images": self.folder})
+
+        self.assertEqual(counts, {})
+        self.assertEqual([level for level, _, _ in records], [logging.ERROR])
+
+
+class MoveBatchUringTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self._tmp.name, "Images")
+        os.mkdir(self.folder)
+        self.batch = []
+        for name in ("done.jpg", "missing.jpg", "exdev.jpg", "leftover.jpg", "unreported.jpg"):
+            src = os.path.join(self._tmp.name, name)
+            Path(src).touch()
+            self.batch.append((name, src, "Images", name))
+        # Renamed by the kernel but never reported back
+        os.rename(self.batch[4][1], os.path.join(self.folder, "unreported.jpg"))
+        os.rename(self.batch[0][1], os.path.join(self.folder, "done.jpg"))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_results_are_mapped_to_outcomes(self) -> None:
+        results = [0, -errno.ENOENT, -errno.EXDEV, None, None]
+        with mock.patch.object(main, "rename_batch_uring", return_value=results):
+            counts, records = main.move_batch_uring(
+                None, self.batch, {"Images": self.folder}
+            )
+
+        self.assertEqual(counts, {"Images": 4})
+        self.assertEqual(len(records), 1)
+        level, _, args = records[0]
+        self.assertEqual(level, logging.ERROR)
+        self.assertEqual(args[0], "missing.jpg")
+        self.assertEqual(
+            sorted(os.listdir(self.folder)),
+            ["done.jpg", "exdev.jpg", "leftover.jpg", "unreported.jpg"],
+        )
+        self.assertTrue(os.path.exists(self.batch[1][1]))
+
+    def test_only_leftover_entries_are_renamed_again(self) -> None:
+        results = [0, -errno.ENOENT, -errno.EXDEV, None, None]
+        with mock.patch.object(main, "rename_batch_uring", return_value=results), \
+                mock.patch.object(main, "move_batch", wraps=main.move_batch) as move_batch:
+            main.move_batch_uring(None, self.batch, {"Images": self.folder})
+
+        move_batch.assert_called_once_with([self.batch[3]], {"Images": self.folder})
+
+
+class CollectFilesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.target = self._tmp.name
+        for parts in (("a.jpg",), ("sub", "b.py"), ("Images", "c.jpg")):
+            path = Path(self.target).joinpath(*parts)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_recursive_skips_category_folders(self) -> None:
+        names, _ = main.collect_files(self.target, recursive=True)
+
+        self.assertEqual(sorted(names), ["a.jpg", "b.py"])
+
+    def test_unreadable_subdirectory_is_skipped(self) -> None:
+        scandir = os.scandir
+        sub = os.path.join(self.target, "sub")
+
+        def failing_scandir(path):
+            if path == sub:
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        with mock.patch.object(main.os, "scandir", side_effect=failing_scandir):
+            with self.assertLogs(level="WARNING"):
+                names, _ = main.collect_files(self.target, recursive=True)
+
+        self.assertEqual(names, ["a.jpg"])
+
+
+if __name__ == "__main__":
+    unittest.main()